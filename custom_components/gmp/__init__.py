@@ -1,6 +1,8 @@
+import aiohttp
+
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
 from .const import (
     CONF_ACCOUNT_ID,
@@ -18,7 +20,16 @@ PLATFORMS = ["sensor", "select"]
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
     hass.data.setdefault(DOMAIN, {})
 
-    session = async_get_clientsession(hass)
+    # Dedicated session with a pool sized for the six concurrent coordinator
+    # calls, so connections stay warm across polls instead of competing with
+    # the rest of HA for the shared pool.
+    session = aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(
+            limit=8,
+            limit_per_host=8,
+            keepalive_timeout=75,
+        )
+    )
     client = GMPClient(
         session=session,
         username=entry.data[CONF_USERNAME],
@@ -32,17 +43,35 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
         entry.data[CONF_ACCOUNT_ID],
     )
 
-    await coordinator.async_config_entry_first_refresh()
+    async def _async_close_session(event=None) -> None:
+        await session.close()
+
+    # aiohttp warns about sessions still open at shutdown; the listener is
+    # removed again when the entry unloads and closes the session itself.
+    entry.async_on_unload(
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, _async_close_session)
+    )
+
+    try:
+        await coordinator.async_config_entry_first_refresh()
 
-    hass.data[DOMAIN][entry.entry_id] = coordinator
+        hass.data[DOMAIN][entry.entry_id] = {
+            "coordinator": coordinator,
+            "session": session,
+        }
 
-    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+        await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    except Exception:
+        hass.data[DOMAIN].pop(entry.entry_id, None)
+        await session.close()
+        raise
 
     return True
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry):
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok:
-        hass.data[DOMAIN].pop(entry.entry_id)
+        data = hass.data[DOMAIN].pop(entry.entry_id)
+        await data["session"].close()
 
     return unload_ok
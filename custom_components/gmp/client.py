@@ -1,30 +1,79 @@
 from __future__ import annotations
 
+import asyncio
 from dataclasses import dataclass
 import calendar
-from datetime import date, datetime, time as dtime, timezone
+from datetime import date, datetime, time as dtime, timezone, tzinfo as _TZInfo
+from functools import lru_cache
 import base64
 import json
-import re
+import logging
 import time
 from typing import Any, Optional
 from urllib.parse import urlencode
 
 import aiohttp
+import orjson
 
 from .exceptions import GMPAuthError, GMPConnectionError, GMPNoUsageDataError
 
+_LOGGER = logging.getLogger(__name__)
+
+_ACCOUNT_ID_KEYS = {"accountId", "account_id", "accountNumber", "account"}
+
+
+def _looks_like_account_id(s: str) -> bool:
+    # Equivalent to fullmatch(r"\d{6,}") without the regex dispatch.
+    return len(s) >= 6 and s.isdigit()
+
+
+@lru_cache(maxsize=2)
+def _monthly_range(year: int, month: int, tz: _TZInfo) -> tuple[datetime, datetime]:
+    """Start/end of the trailing 12-month window ending in (year, month)."""
+    start_offset_years, start_month_index = divmod(month - 13, 12)
+    range_start = datetime(
+        year + start_offset_years, start_month_index + 1, 1, tzinfo=tz
+    )
+    last_day = calendar.monthrange(year, month)[1]
+    range_end = datetime(year, month, last_day, 23, 59, 59, tzinfo=tz)
+    return range_start, range_end
+
 @dataclass(frozen=True)
 class GMPTokens:
     access_token: str
     refresh_token: Optional[str]
     expires_at: float
+    claims: Optional[dict[str, Any]] = None
+
+
+def _decode_jwt_claims(access_token: Any) -> Optional[dict[str, Any]]:
+
+    if not isinstance(access_token, str):
+        return None
+
+    parts = access_token.split(".")
+    if len(parts) != 3:
+        return None
+
+    payload = parts[1]
+    pad = "=" * (-len(payload) % 4)
+    try:
+        decoded = base64.urlsafe_b64decode(payload + pad)
+        data = json.loads(decoded.decode("utf-8"))
+    except Exception:
+        return None
+
+    return data if isinstance(data, dict) else None
 
 class GMPClient:
 
     BASE_URL = "https://api.greenmountainpower.com/api/v2"
     GMP_SOURCE = "web"
     TEMP_UNIT = "f"
+    EV_RETRY_INTERVAL = 86400  # seconds before re-probing an absent EV endpoint
+    TOKEN_REFRESH_MARGIN = 360  # start refreshing this many seconds before expiry
+    TOKEN_EXPIRY_SLACK = 60  # block on the refresh when this close to expiry
+    CONDITIONAL_CACHE_MAX = 32  # conditional-GET entries kept, FIFO eviction
 
     def __init__(
         self,
@@ -39,6 +88,33 @@ class GMPClient:
         self._client_id = client_id
 
         self._tokens: Optional[GMPTokens] = None
+        # Auth header dict rebuilt only when the token changes; aiohttp
+        # copies headers, so sharing the same dict across requests is safe.
+        self._cached_auth_headers: Optional[dict[str, str]] = None
+        self._refresh_lock = asyncio.Lock()
+        self._refresh_task: Optional[asyncio.Task] = None
+        # Winning url index per usage endpoint, so steady-state polls make
+        # one request instead of re-probing every variant.
+        self._endpoint_variant: dict[str, int] = {}
+        # Constant query suffix and month-scoped candidate URL lists; the
+        # date-range URLs only change when the month rolls over (or the UTC
+        # offset flips at a DST transition), so there is no need to
+        # urlencode them on every poll.
+        self._temp_suffix = f"?temp={self.TEMP_UNIT}"
+        self._month_url_cache: dict[
+            tuple[str, str], tuple[tuple[Any, ...], list[str]]
+        ] = {}
+        # Per-URL (etag, last_modified, body) for conditional GETs; slow-moving
+        # endpoints like status and monthly mostly answer 304 between changes.
+        self._conditional_cache: dict[
+            str, tuple[Optional[str], Optional[str], Any]
+        ] = {}
+        # Hourly payloads for completed days, keyed by (account, ISO day).
+        # Past days are immutable, so they never need refetching.
+        self._hourly_cache: dict[tuple[str, str], dict[str, Any]] = {}
+        # Accounts without an EV device fail every variant; skip the endpoint
+        # until this deadline instead of re-probing each poll.
+        self._ev_disabled_until: float = 0.0
 
     async def async_login(self) -> None:
         url = f"{self.BASE_URL}/applications/token?remember_me=true"
@@ -63,6 +139,7 @@ class GMPClient:
             raise GMPConnectionError(str(err)) from err
 
         self._tokens = self._parse_tokens(result)
+        self._cached_auth_headers = None
 
     def _parse_tokens(self, result: dict[str, Any]) -> GMPTokens:
         access_token = result.get("access_token")
@@ -78,6 +155,8 @@ class GMPClient:
             access_token=access_token,
             refresh_token=refresh_token,
             expires_at=time.time() + float(expires_in),
+            # Decode once here; the token only changes on login/refresh.
+            claims=_decode_jwt_claims(access_token),
         )
 
     async def async_refresh_token(self) -> None:
@@ -106,111 +185,224 @@ class GMPClient:
             raise GMPConnectionError(str(err)) from err
 
         self._tokens = self._parse_tokens(result)
+        self._cached_auth_headers = None
+
+    def _token_is_fresh(self) -> bool:
+        return (
+            bool(self._tokens)
+            and time.time() <= self._tokens.expires_at - self.TOKEN_REFRESH_MARGIN
+        )
+
+    async def _async_refresh_locked(self) -> None:
+        async with self._refresh_lock:
+            # Another coroutine may have refreshed while we waited on the lock.
+            if self._token_is_fresh():
+                return
+            if self._tokens:
+                await self.async_refresh_token()
+            else:
+                await self.async_login()
+
+    async def _async_recover_from_unauthorized(self, stale: Optional[GMPTokens]) -> None:
+        """Refresh after a 401/403, unless another coroutine already did."""
+        async with self._refresh_lock:
+            if self._tokens is not stale:
+                return
+            await self.async_refresh_token()
+
+    def _on_refresh_task_done(self, task: asyncio.Task) -> None:
+        # Consume the outcome of background refreshes so a failed proactive
+        # refresh degrades into the blocking path on the next call instead
+        # of leaving a "Task exception was never retrieved" traceback.
+        if self._refresh_task is task:
+            self._refresh_task = None
+        if task.cancelled():
+            return
+        err = task.exception()
+        if err is not None:
+            _LOGGER.debug("Proactive token refresh failed: %s", err)
 
     async def async_ensure_token(self) -> None:
-        if not self._tokens:
-            await self.async_login()
+        if self._token_is_fresh():
             return
 
-        if time.time() > self._tokens.expires_at - 60:
-            await self.async_refresh_token()
+        # Share one in-flight refresh between concurrent callers so only a
+        # single coroutine hits /applications/token per refresh window.
+        task = self._refresh_task
+        if task is None or task.done():
+            task = asyncio.ensure_future(self._async_refresh_locked())
+            task.add_done_callback(self._on_refresh_task_done)
+            self._refresh_task = task
+
+        # Inside the proactive window the current token still works, so let
+        # the refresh finish in the background; only block when the token is
+        # genuinely about to expire (or missing).
+        if self._tokens and time.time() <= self._tokens.expires_at - self.TOKEN_EXPIRY_SLACK:
+            return
+        await task
 
     def _auth_headers(self) -> dict[str, str]:
         if not self._tokens:
             return {"GMP-Source": self.GMP_SOURCE}
 
-        return {
-            "Authorization": f"Bearer {self._tokens.access_token}",
-            "GMP-Source": self.GMP_SOURCE,
-        }
+        headers = self._cached_auth_headers
+        if headers is None:
+            headers = self._cached_auth_headers = {
+                "Authorization": f"Bearer {self._tokens.access_token}",
+                "GMP-Source": self.GMP_SOURCE,
+            }
+        return headers
+
+    def _local_timezone(self) -> _TZInfo:
+        # Recomputed per call: astimezone() yields a fixed-offset tzinfo, so
+        # memoizing it would keep the pre-DST offset until restart.
+        return datetime.now().astimezone().tzinfo
 
     def _with_params(self, base_url: str, params: dict[str, Any]) -> str:
 
         return f"{base_url}?{urlencode(params)}"
 
-    async def _async_get_json(self, url: str, *, include_auth: bool = True) -> dict[str, Any]:
-        await self.async_ensure_token()
+    def _conditional_headers(self, url: str, headers: dict[str, str]) -> dict[str, str]:
+        cached = self._conditional_cache.get(url)
+        if not cached:
+            return headers
+
+        etag, last_modified, _ = cached
+        headers = dict(headers)
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+        return headers
+
+    def _store_conditional(self, url: str, resp: aiohttp.ClientResponse, body: Any) -> None:
+        etag = resp.headers.get("ETag")
+        last_modified = resp.headers.get("Last-Modified")
+        if not (etag or last_modified):
+            return
 
-        headers = self._auth_headers() if include_auth else {"GMP-Source": self.GMP_SOURCE}
+        # Re-insert so dict order doubles as FIFO, then evict the oldest
+        # entries; each one holds a full response body.
+        cache = self._conditional_cache
+        cache.pop(url, None)
+        cache[url] = (etag, last_modified, body)
+        while len(cache) > self.CONDITIONAL_CACHE_MAX:
+            del cache[next(iter(cache))]
 
-        try:
-            async with self._session.get(url, headers=headers) as resp:
-                if resp.status in (401, 403) and include_auth:
-                    await self.async_refresh_token()
-                    async with self._session.get(url, headers=self._auth_headers()) as retry_resp:
-                        if retry_resp.status >= 400:
-                            body = await retry_resp.text()
-                            if retry_resp.status == 404:
-                                try:
-                                    payload = json.loads(body) if body else None
-                                except Exception:
-                                    payload = None
-                                if (
-                                    isinstance(payload, dict)
-                                    and payload.get("errorCode") == "USAGE_DATA_NOT_FOUND"
-                                ):
-                                    raise GMPNoUsageDataError(
-                                        payload.get("message")
-                                        or "Usage data not found for requested dates"
-                                    )
-                            if retry_resp.status in (401, 403):
-                                raise GMPAuthError("Unauthorized")
-                            raise GMPConnectionError(
-                                f"{retry_resp.status} for {url}: {body[:500]}"
-                            )
-                        return await retry_resp.json(content_type=None)
-
-                if resp.status >= 400:
-                    body = await resp.text()
-                    if resp.status == 404:
-                        try:
-                            payload = json.loads(body) if body else None
-                        except Exception:
-                            payload = None
-                        if (
-                            isinstance(payload, dict)
-                            and payload.get("errorCode") == "USAGE_DATA_NOT_FOUND"
-                        ):
-                            raise GMPNoUsageDataError(
-                                payload.get("message")
-                                or "Usage data not found for requested dates"
-                            )
-                    if resp.status in (401, 403):
-                        raise GMPAuthError("Unauthorized")
-                    raise GMPConnectionError(f"{resp.status} for {url}: {body[:500]}")
-
-                return await resp.json(content_type=None)
-        except aiohttp.ClientError as err:
-            raise GMPConnectionError(str(err)) from err
+    async def _do_request(
+        self, url: str, headers: dict[str, str], conditional: bool = False
+    ) -> dict[str, Any]:
+        """Single GET with opt-in conditional-cache and error mapping; no retries.
+
+        Conditional GETs only make sense for URLs that repeat across polls
+        (status and the month-scoped usage endpoints); timestamped URLs
+        would fill the cache with keys that are never requested again.
+        """
+        if conditional:
+            headers = self._conditional_headers(url, headers)
+        async with self._session.get(url, headers=headers) as resp:
+            if conditional and resp.status == 304:
+                cached = self._conditional_cache.get(url)
+                if cached is not None:
+                    return cached[2]
+
+            if resp.status >= 400:
+                body = await resp.text()
+                if resp.status == 404:
+                    try:
+                        payload = json.loads(body) if body else None
+                    except Exception:
+                        payload = None
+                    if (
+                        isinstance(payload, dict)
+                        and payload.get("errorCode") == "USAGE_DATA_NOT_FOUND"
+                    ):
+                        raise GMPNoUsageDataError(
+                            payload.get("message")
+                            or "Usage data not found for requested dates"
+                        )
+                if resp.status in (401, 403):
+                    raise GMPAuthError("Unauthorized")
+                raise GMPConnectionError(f"{resp.status} for {url}: {body[:500]}")
 
-    async def async_get_account_status(self, account_id: str) -> dict[str, Any]:
-        url = f"{self.BASE_URL}/accounts/{account_id}/status"
-        return await self._async_get_json(url)
+            result = orjson.loads(await resp.read())
+            if conditional:
+                self._store_conditional(url, resp, result)
+            return result
 
-    def _token_claims(self) -> dict[str, Any] | None:
+    async def _async_get_json(self, url: str, conditional: bool = False) -> dict[str, Any]:
+        await self.async_ensure_token()
 
-        if not self._tokens or not isinstance(self._tokens.access_token, str):
-            return None
+        tokens_used = self._tokens
+        try:
+            try:
+                return await self._do_request(url, self._auth_headers(), conditional)
+            except GMPAuthError:
+                await self._async_recover_from_unauthorized(tokens_used)
+                return await self._do_request(url, self._auth_headers(), conditional)
+        except aiohttp.ClientError as err:
+            raise GMPConnectionError(str(err)) from err
 
-        token = self._tokens.access_token
-        parts = token.split(".")
-        if len(parts) != 3:
-            return None
+    async def _async_probe_variants(self, key: str, urls: list[str]) -> dict[str, Any]:
+        """GET the first URL variant that works, remembering the winner.
 
-        payload = parts[1]
-        pad = "=" * (-len(payload) % 4)
+        The GMP API exposes several flavors of each usage endpoint depending
+        on account type; after a successful probe we go straight to the
+        known-good variant instead of re-walking the whole list every poll.
+        """
+        url_index = self._endpoint_variant.get(key)
+        if url_index is not None and url_index < len(urls):
+            try:
+                return await self._async_get_json(urls[url_index], conditional=True)
+            except GMPAuthError:
+                raise
+            except Exception:
+                # Variant stopped working; forget it and re-probe below.
+                self._endpoint_variant.pop(key, None)
+
+        # First-ever call (or cache miss): probe every variant concurrently
+        # and take the first success, cancelling the rest.
+        tasks: dict[asyncio.Task, int] = {
+            asyncio.create_task(self._async_get_json(url, conditional=True)): url_index
+            for url_index, url in enumerate(urls)
+        }
+        pending: set[asyncio.Task] = set(tasks)
+        last_err: Exception | None = None
         try:
-            decoded = base64.urlsafe_b64decode(payload + pad)
-            data = json.loads(decoded.decode("utf-8"))
-        except Exception:
-            return None
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                # Retrieve every exception in the batch before returning so
+                # losers finishing alongside the winner don't leave
+                # "Task exception was never retrieved" log spam behind.
+                winner: asyncio.Task | None = None
+                for task in done:
+                    err = task.exception()
+                    if err is not None:
+                        last_err = err
+                    elif winner is None or tasks[task] < tasks[winner]:
+                        # Prefer the earliest variant when several succeed.
+                        winner = task
+                if winner is not None:
+                    self._endpoint_variant[key] = tasks[winner]
+                    return winner.result()
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+        assert last_err is not None
+        raise last_err
 
-        return data if isinstance(data, dict) else None
+    async def async_get_account_status(self, account_id: str) -> dict[str, Any]:
+        url = f"{self.BASE_URL}/accounts/{account_id}/status"
+        return await self._async_get_json(url, conditional=True)
 
-    def _extract_account_ids(self, obj: Any, *, depth: int = 0) -> set[str]:
+    def _token_claims(self) -> dict[str, Any] | None:
+        return self._tokens.claims if self._tokens else None
 
-        if depth > 6:
-            return set()
+    def _extract_account_ids(self, obj: Any) -> set[str]:
 
         found: set[str] = set()
 
@@ -222,23 +414,47 @@ class GMPClient:
             else:
                 return
 
-            if re.fullmatch(r"\d{6,}", s):
+            if _looks_like_account_id(s):
                 found.add(s)
 
-        if isinstance(obj, dict):
-            for key, value in obj.items():
-                if key in {"accountId", "account_id", "accountNumber", "account"}:
-                    _maybe_add(value)
-                found |= self._extract_account_ids(value, depth=depth + 1)
-            return found
+        # Iterative walk with an explicit stack; one accumulator set instead
+        # of a temporary set per recursion level.
+        stack: list[tuple[Any, int]] = [(obj, 0)]
+        while stack:
+            node, depth = stack.pop()
+            if depth > 6:
+                continue
+
+            if isinstance(node, dict):
+                for key, value in node.items():
+                    if key in _ACCOUNT_ID_KEYS:
+                        _maybe_add(value)
+                    stack.append((value, depth + 1))
+            elif isinstance(node, list):
+                for item in node:
+                    if isinstance(item, str):
+                        _maybe_add(item)
+                    else:
+                        stack.append((item, depth + 1))
+
+        return found
 
-        if isinstance(obj, list):
-            for item in obj:
-                if isinstance(item, str) and re.fullmatch(r"\d{6,}", item.strip()):
-                    found.add(item.strip())
-                found |= self._extract_account_ids(item, depth=depth + 1)
-            return found
+    @staticmethod
+    def _accounts_fast_path(data: Any) -> set[str]:
+        """Pull account ids straight out of the known /accounts shape."""
+        accounts = data.get("accounts", data) if isinstance(data, dict) else data
+        if not isinstance(accounts, list):
+            return set()
 
+        found: set[str] = set()
+        for account in accounts:
+            if not isinstance(account, dict):
+                continue
+            raw = account.get("accountNumber") or account.get("accountId")
+            if isinstance(raw, int):
+                raw = str(raw)
+            if isinstance(raw, str) and _looks_like_account_id(raw.strip()):
+                found.add(raw.strip())
         return found
 
     async def async_discover_account_ids(self) -> list[str]:
@@ -263,145 +479,171 @@ class GMPClient:
                 data = await self._async_get_json(url)
             except Exception:
                 continue
-            account_ids |= self._extract_account_ids(data)
 
-        return sorted(account_ids)
-
-    async def async_get_monthly_usage(self, account_id: str) -> dict[str, Any]:
-        base_url = f"{self.BASE_URL}/usage/{account_id}/monthly"
-
-        now = datetime.now().astimezone()
-        local_tz = now.tzinfo
-        start_year = now.year
-        start_month = now.month - 12
-        while start_month <= 0:
-            start_month += 12
-            start_year -= 1
-
-        range_start = datetime(start_year, start_month, 1, 0, 0, 0, tzinfo=local_tz)
-        last_day = calendar.monthrange(now.year, now.month)[1]
-        range_end = datetime(now.year, now.month, last_day, 23, 59, 59, tzinfo=local_tz)
-
-        range_params_dt = {
-            "startDate": range_start.isoformat(),
-            "endDate": range_end.isoformat(),
-            "temp": self.TEMP_UNIT,
-        }
-        range_params_date = {
-            "startDate": range_start.date().isoformat(),
-            "endDate": range_end.date().isoformat(),
-            "temp": self.TEMP_UNIT,
-        }
+            # The /accounts payload has a known structure; only fall back to
+            # the generic deep walk when the direct lookup finds nothing.
+            direct = self._accounts_fast_path(data)
+            if direct:
+                account_ids |= direct
+            else:
+                account_ids |= self._extract_account_ids(data)
 
-        urls = [
-            base_url,
-            self._with_params(base_url, {"temp": self.TEMP_UNIT}),
-            self._with_params(base_url, range_params_date),
-            self._with_params(base_url, range_params_dt),
-        ]
+        return sorted(account_ids)
 
-        last_err: Exception | None = None
-        for url in urls:
-            for include_auth in (True, False):
-                try:
-                    return await self._async_get_json(url, include_auth=include_auth)
-                except Exception as err:
-                    last_err = err
-        assert last_err is not None
-        raise last_err
+    async def async_get_monthly_usage(
+        self, account_id: str, *, ref_now: Optional[datetime] = None
+    ) -> dict[str, Any]:
+        now = ref_now if ref_now is not None else datetime.now().astimezone()
+        cache_key = ("monthly", account_id)
+        cached = self._month_url_cache.get(cache_key)
+        if cached is not None and cached[0] == (now.year, now.month, now.utcoffset()):
+            urls = cached[1]
+        else:
+            base_url = f"{self.BASE_URL}/usage/{account_id}/monthly"
+            range_start, range_end = _monthly_range(now.year, now.month, now.tzinfo)
+
+            range_params_dt = {
+                "startDate": range_start.isoformat(),
+                "endDate": range_end.isoformat(),
+                "temp": self.TEMP_UNIT,
+            }
+            range_params_date = {
+                "startDate": range_start.date().isoformat(),
+                "endDate": range_end.date().isoformat(),
+                "temp": self.TEMP_UNIT,
+            }
 
-    async def async_get_daily_usage(self, account_id: str) -> dict[str, Any]:
-        base_url = f"{self.BASE_URL}/usage/{account_id}/daily"
-        urls = [self._with_params(base_url, {"temp": self.TEMP_UNIT}), base_url]
+            urls = [
+                base_url,
+                base_url + self._temp_suffix,
+                self._with_params(base_url, range_params_date),
+                self._with_params(base_url, range_params_dt),
+            ]
+            self._month_url_cache[cache_key] = (
+                (now.year, now.month, now.utcoffset()),
+                urls,
+            )
 
-        now = datetime.now().astimezone()
-        month_start = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
-        last_day = calendar.monthrange(month_start.year, month_start.month)[1]
-        month_end = month_start.replace(day=last_day, hour=23, minute=59, second=59)
+        return await self._async_probe_variants("monthly", urls)
 
-        urls.append(
-            self._with_params(
-                base_url,
-                {
-                    "startDate": month_start.date().isoformat(),
-                    "endDate": month_end.date().isoformat(),
-                    "temp": self.TEMP_UNIT,
-                },
+    async def async_get_daily_usage(
+        self, account_id: str, *, ref_now: Optional[datetime] = None
+    ) -> dict[str, Any]:
+        now = ref_now if ref_now is not None else datetime.now().astimezone()
+        cache_key = ("daily", account_id)
+        cached = self._month_url_cache.get(cache_key)
+        if cached is not None and cached[0] == (now.year, now.month, now.utcoffset()):
+            urls = cached[1]
+        else:
+            base_url = f"{self.BASE_URL}/usage/{account_id}/daily"
+            urls = [base_url + self._temp_suffix, base_url]
+
+            month_start = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+            last_day = calendar.monthrange(month_start.year, month_start.month)[1]
+            month_end = month_start.replace(day=last_day, hour=23, minute=59, second=59)
+
+            urls.append(
+                self._with_params(
+                    base_url,
+                    {
+                        "startDate": month_start.date().isoformat(),
+                        "endDate": month_end.date().isoformat(),
+                        "temp": self.TEMP_UNIT,
+                    },
+                )
             )
-        )
-        urls.append(
-            self._with_params(
-                base_url,
-                {
-                    "startDate": month_start.isoformat(),
-                    "endDate": month_end.isoformat(),
-                    "temp": self.TEMP_UNIT,
-                },
+            urls.append(
+                self._with_params(
+                    base_url,
+                    {
+                        "startDate": month_start.isoformat(),
+                        "endDate": month_end.isoformat(),
+                        "temp": self.TEMP_UNIT,
+                    },
+                )
+            )
+            self._month_url_cache[cache_key] = (
+                (now.year, now.month, now.utcoffset()),
+                urls,
             )
-        )
 
-        last_err: Exception | None = None
-        for url in urls:
-            for include_auth in (True, False):
-                try:
-                    return await self._async_get_json(url, include_auth=include_auth)
-                except Exception as err:
-                    last_err = err
-        assert last_err is not None
-        raise last_err
+        return await self._async_probe_variants("daily", urls)
 
     async def async_get_hourly_for_day(self, account_id: str, day: date) -> dict[str, Any]:
-        local_tz = datetime.now().astimezone().tzinfo
+        is_past_day = day < date.today()
+        cache_key = (account_id, day.isoformat())
+        if is_past_day:
+            cached = self._hourly_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        local_tz = self._local_timezone()
         start = datetime.combine(day, dtime.min).replace(tzinfo=local_tz)
         end = datetime.combine(day, dtime(23, 59, 59)).replace(tzinfo=local_tz)
-        return await self.async_get_hourly(account_id, start, end)
-
-    async def async_get_ev_energy_daily(self, account_id: str) -> dict[str, Any]:
-        base_url = f"{self.BASE_URL}/device/account/{account_id}/ev/energy/daily"
-
-        now = datetime.now().astimezone()
-        local_tz = now.tzinfo
-        month_start = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
-        last_day = calendar.monthrange(month_start.year, month_start.month)[1]
-        month_end = datetime(
-            month_start.year,
-            month_start.month,
-            last_day,
-            23,
-            59,
-            59,
-            tzinfo=local_tz,
-        )
+        data = await self.async_get_hourly(account_id, start, end)
 
-        urls = [
-            self._with_params(
-                base_url,
-                {"startDate": month_start.date().isoformat(), "endDate": month_end.date().isoformat()},
-            ),
-            self._with_params(
-                base_url,
-                {"startDate": month_start.isoformat(), "endDate": month_end.isoformat()},
-            ),
-            self._with_params(
-                base_url,
-                {"start": month_start.isoformat(), "end": month_end.isoformat()},
-            ),
-            self._with_params(
-                base_url,
-                {"start": month_start.date().isoformat(), "end": month_end.date().isoformat()},
-            ),
-        ]
+        # Only completed days are safe to reuse; today keeps refetching.
+        if is_past_day and data.get("intervals"):
+            self._hourly_cache[cache_key] = data
+        return data
 
-        last_err: Exception | None = None
-        for url in urls:
-            for include_auth in (True, False):
-                try:
-                    return await self._async_get_json(url, include_auth=include_auth)
-                except Exception as err:
-                    last_err = err
+    async def async_get_ev_energy_daily(
+        self, account_id: str, *, ref_now: Optional[datetime] = None
+    ) -> dict[str, Any]:
+        if time.time() < self._ev_disabled_until:
+            raise GMPNoUsageDataError("EV usage not available for this account")
+
+        now = ref_now if ref_now is not None else datetime.now().astimezone()
+        cache_key = ("ev_daily", account_id)
+        cached = self._month_url_cache.get(cache_key)
+        if cached is not None and cached[0] == (now.year, now.month, now.utcoffset()):
+            urls = cached[1]
+        else:
+            base_url = f"{self.BASE_URL}/device/account/{account_id}/ev/energy/daily"
+            local_tz = now.tzinfo
+            month_start = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+            last_day = calendar.monthrange(month_start.year, month_start.month)[1]
+            month_end = datetime(
+                month_start.year,
+                month_start.month,
+                last_day,
+                23,
+                59,
+                59,
+                tzinfo=local_tz,
+            )
 
-        assert last_err is not None
-        raise last_err
+            urls = [
+                self._with_params(
+                    base_url,
+                    {"startDate": month_start.date().isoformat(), "endDate": month_end.date().isoformat()},
+                ),
+                self._with_params(
+                    base_url,
+                    {"startDate": month_start.isoformat(), "endDate": month_end.isoformat()},
+                ),
+                self._with_params(
+                    base_url,
+                    {"start": month_start.isoformat(), "end": month_end.isoformat()},
+                ),
+                self._with_params(
+                    base_url,
+                    {"start": month_start.date().isoformat(), "end": month_end.date().isoformat()},
+                ),
+            ]
+            self._month_url_cache[cache_key] = (
+                (now.year, now.month, now.utcoffset()),
+                urls,
+            )
+
+        try:
+            return await self._async_probe_variants("ev_daily", urls)
+        except GMPNoUsageDataError:
+            # The API answered but has no EV data: no EV device on the
+            # account, so stop probing for a day. Auth and connection
+            # failures say nothing about EV presence and retry next poll.
+            self._ev_disabled_until = time.time() + self.EV_RETRY_INTERVAL
+            raise
 
     async def async_get_hourly(
         self,
@@ -428,9 +670,11 @@ class GMPClient:
         except GMPNoUsageDataError:
             return {"intervals": []}
 
-    async def async_get_usage_summary(self, account_id: str) -> dict[str, Any]:
+    async def async_get_usage_summary(
+        self, account_id: str, *, ref_now: Optional[datetime] = None
+    ) -> dict[str, Any]:
 
-        now = datetime.now().astimezone()
+        now = ref_now if ref_now is not None else datetime.now().astimezone()
         start = now.replace(hour=0, minute=0, second=0, microsecond=0)
         data = await self.async_get_hourly(account_id, start, now)
 
@@ -443,14 +687,13 @@ class GMPClient:
             }
 
         values = intervals[0].get("values") or []
-        total_today = 0.0
-        last_consumed = 0.0
-
-        for item in values:
-            consumed = item.get("consumed")
-            if isinstance(consumed, (int, float)):
-                total_today += float(consumed)
-                last_consumed = float(consumed)
+        nums = [
+            float(item["consumed"])
+            for item in values
+            if isinstance(item.get("consumed"), (int, float))
+        ]
+        total_today = sum(nums)
+        last_consumed = nums[-1] if nums else 0.0
 
         return {
             "hourly_values": values,
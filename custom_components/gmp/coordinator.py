@@ -1,4 +1,8 @@
-from datetime import date, timedelta
+from collections.abc import Mapping
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from types import MappingProxyType
+from typing import Any
 import logging
 import asyncio
 
@@ -8,9 +12,173 @@ from homeassistant.helpers.update_coordinator import UpdateFailed
 
 from .const import DOMAIN, DEFAULT_SCAN_INTERVAL
 from .exceptions import GMPError
+from .usage import (
+    columnize_usage,
+    ev_interval,
+    latest_numeric_any,
+    power_status,
+    selected_day_total,
+    usage_start_end,
+    usage_values,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
+_EV_PERIOD_ATTR_KEYS = (
+    "start",
+    "end",
+    "totalCost",
+    "totalSavings",
+    "totalChargeTime",
+    "totalOnPeakConsumption",
+    "totalOffPeakConsumption",
+    "totalOnPeakCost",
+    "totalOffPeakCost",
+)
+_EV_SELECTED_ATTR_KEYS = (
+    "cost",
+    "savings",
+    "duration",
+    "onPeakConsumed",
+    "offPeakConsumed",
+    "onPeakCost",
+    "offPeakCost",
+    "onPeakDuration",
+    "offPeakDuration",
+)
+
+
+@dataclass(slots=True, frozen=True)
+class GMPSnapshot:
+    """Per-refresh normalized view of the raw API payloads.
+
+    Entity properties read these fields with C-level slot access instead of
+    hashing keys into the untyped coordinator data dict on every state write.
+    """
+
+    today_total: float | None
+    last_hour_kwh: float | None
+    hourly_columns: dict[str, tuple[Any, ...]]
+    status: dict[str, Any]
+    power: str | None
+    status_with_power: Mapping[str, Any]
+    daily_latest: float | None
+    daily_start_end: tuple[Any, Any]
+    daily_columns: dict[str, tuple[Any, ...]]
+    monthly_latest: float | None
+    monthly_start_end: tuple[Any, Any]
+    monthly_columns: dict[str, tuple[Any, ...]]
+    selected_date: str | None
+    selected_day_total: float | None
+    selected_columns: dict[str, tuple[Any, ...]]
+    errors: dict[str, str]
+    ev_interval: dict[str, Any]
+    ev_daily_by_date: dict[str, dict[str, Any]]
+    ev_selected_item: dict[str, Any]
+    ev_total_consumption: float | None
+    ev_total_cost: float | None
+    ev_selected_consumption: float | None
+    ev_selected_cost: float | None
+    ev_period_attrs: Mapping[str, Any]
+    ev_selected_attrs: Mapping[str, Any]
+
+
+def _as_float(val: Any) -> float | None:
+    return float(val) if isinstance(val, (int, float)) else None
+
+
+def _reuse_if_equal(prev: Any, new: Any) -> Any:
+    # Hand back the previous refresh's object when the content didn't
+    # change, so HA's identity check on attributes short-circuits before
+    # it falls back to a deep compare of the new object.
+    return prev if prev == new else new
+
+
+def _build_snapshot(data: dict, prev: GMPSnapshot | None = None) -> GMPSnapshot:
+    """Normalize the raw payloads once per refresh.
+
+    Home Assistant reads entity properties several times per state write,
+    so anything derived here is a slot read on the hot path instead of a
+    repeated tree walk over the raw API responses. Passing the previous
+    snapshot lets unchanged attribute payloads keep their identity across
+    refreshes.
+    """
+    daily_values = usage_values(data.get("daily"))
+    monthly_values = usage_values(data.get("monthly"))
+    selected_values = usage_values(data.get("selected_hourly"))
+
+    # Power state and the merged status attributes are derived once; the
+    # status sensors previously shallow-copied the status dict per read.
+    status = data.get("status") or {}
+    power = power_status(status)
+    status_with_power = MappingProxyType({**status, "power_status": power})
+
+    # Index EV daily values by ISO day so the selected-day EV sensors do a
+    # single dict lookup instead of each rescanning the values list.
+    interval = ev_interval(data.get("ev_daily")) or {}
+    ev_daily_by_date = {
+        item["date"][:10]: item
+        for item in interval.get("values") or []
+        if isinstance(item, dict) and isinstance(item.get("date"), str)
+    }
+
+    # EV attribute dicts are built once here and shared as read-only
+    # mappings, so attribute reads don't rebuild ~10-key dicts each time.
+    # dict(zip(...)) over the fixed key tuples sizes the table up front
+    # and runs the fill in C instead of growing key by key.
+    period_attrs = dict(zip(_EV_PERIOD_ATTR_KEYS, map(interval.get, _EV_PERIOD_ATTR_KEYS)))
+    period_attrs["rates"] = (data.get("ev_daily") or {}).get("rates")
+
+    selected_item = ev_daily_by_date.get(data.get("selected_date")) or {}
+    selected_attrs = {"selected_date": data.get("selected_date")}
+    selected_attrs.update(
+        zip(_EV_SELECTED_ATTR_KEYS, map(selected_item.get, _EV_SELECTED_ATTR_KEYS))
+    )
+
+    hourly_columns = columnize_usage(data.get("hourly_values") or [])
+    daily_columns = columnize_usage(daily_values)
+    monthly_columns = columnize_usage(monthly_values)
+    selected_columns = columnize_usage(selected_values)
+    ev_period_attrs: Mapping[str, Any] = MappingProxyType(period_attrs)
+    ev_selected_attrs: Mapping[str, Any] = MappingProxyType(selected_attrs)
+
+    if prev is not None:
+        hourly_columns = _reuse_if_equal(prev.hourly_columns, hourly_columns)
+        daily_columns = _reuse_if_equal(prev.daily_columns, daily_columns)
+        monthly_columns = _reuse_if_equal(prev.monthly_columns, monthly_columns)
+        selected_columns = _reuse_if_equal(prev.selected_columns, selected_columns)
+        status_with_power = _reuse_if_equal(prev.status_with_power, status_with_power)
+        ev_period_attrs = _reuse_if_equal(prev.ev_period_attrs, ev_period_attrs)
+        ev_selected_attrs = _reuse_if_equal(prev.ev_selected_attrs, ev_selected_attrs)
+
+    return GMPSnapshot(
+        today_total=data.get("today_total"),
+        last_hour_kwh=data.get("last_hour_kwh"),
+        hourly_columns=hourly_columns,
+        status=status,
+        power=power,
+        status_with_power=status_with_power,
+        daily_latest=latest_numeric_any(daily_values, ("consumed", "consumedTotal")),
+        daily_start_end=usage_start_end(data.get("daily")),
+        daily_columns=daily_columns,
+        monthly_latest=latest_numeric_any(monthly_values, ("consumed", "consumedTotal")),
+        monthly_start_end=usage_start_end(data.get("monthly")),
+        monthly_columns=monthly_columns,
+        selected_date=data.get("selected_date"),
+        selected_day_total=selected_day_total(selected_values),
+        selected_columns=selected_columns,
+        errors=data.get("errors") or {},
+        ev_interval=interval,
+        ev_daily_by_date=ev_daily_by_date,
+        ev_selected_item=selected_item,
+        ev_total_consumption=_as_float(interval.get("totalConsumption")),
+        ev_total_cost=_as_float(interval.get("totalCost")),
+        ev_selected_consumption=_as_float(selected_item.get("consumed")),
+        ev_selected_cost=_as_float(selected_item.get("cost")),
+        ev_period_attrs=ev_period_attrs,
+        ev_selected_attrs=ev_selected_attrs,
+    )
+
 class GMPCoordinator(DataUpdateCoordinator):
     def __init__(self, hass: HomeAssistant, client, account_id: str):
         super().__init__(
@@ -23,26 +191,45 @@ class GMPCoordinator(DataUpdateCoordinator):
         self.client = client
         self.account_id = account_id
         self.selected_date: date = date.today()
+        self._snapshot: GMPSnapshot | None = None
+
+    @property
+    def snapshot(self) -> GMPSnapshot | None:
+        return self._snapshot
 
     def set_selected_date(self, new_date: date) -> None:
         self.selected_date = new_date
 
     async def _async_update_data(self):
         try:
-            usage_summary, status = await asyncio.gather(
-                self.client.async_get_usage_summary(self.account_id),
-                self.client.async_get_account_status(self.account_id),
-            )
+            # One timestamp per tick, shared by every fetch that needs
+            # month/day boundaries.
+            now = datetime.now().astimezone()
 
-            optional_results = await asyncio.gather(
-                self.client.async_get_monthly_usage(self.account_id),
-                self.client.async_get_daily_usage(self.account_id),
+            # One gather for all six endpoints so a poll pays a single round
+            # trip barrier; the first two are required and re-raised below.
+            (
+                usage_summary,
+                status,
+                monthly,
+                daily,
+                selected_hourly,
+                ev_daily,
+            ) = await asyncio.gather(
+                self.client.async_get_usage_summary(self.account_id, ref_now=now),
+                self.client.async_get_account_status(self.account_id),
+                self.client.async_get_monthly_usage(self.account_id, ref_now=now),
+                self.client.async_get_daily_usage(self.account_id, ref_now=now),
                 self.client.async_get_hourly_for_day(self.account_id, self.selected_date),
-                self.client.async_get_ev_energy_daily(self.account_id),
+                self.client.async_get_ev_energy_daily(self.account_id, ref_now=now),
                 return_exceptions=True,
             )
 
-            monthly, daily, selected_hourly, ev_daily = optional_results
+            if isinstance(usage_summary, Exception):
+                raise usage_summary
+            if isinstance(status, Exception):
+                raise status
+
             errors: dict[str, str] = {}
 
             if isinstance(monthly, Exception):
@@ -62,7 +249,7 @@ class GMPCoordinator(DataUpdateCoordinator):
                 _LOGGER.warning("GMP EV daily fetch failed: %s", ev_daily)
                 ev_daily = {}
 
-            return {
+            data = {
                 **usage_summary,
                 "status": status,
                 "monthly": monthly,
@@ -72,6 +259,8 @@ class GMPCoordinator(DataUpdateCoordinator):
                 "ev_daily": ev_daily,
                 "errors": errors,
             }
+            self._snapshot = _build_snapshot(data, self._snapshot)
+            return data
         except GMPError as err:
             raise UpdateFailed(str(err)) from err
         
\ No newline at end of file
@@ -15,7 +15,7 @@ async def async_setup_entry(
     entry: ConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
-    coordinator = hass.data[DOMAIN][entry.entry_id]
+    coordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
     async_add_entities([GMPHourlyDaySelect(coordinator)])
 
 
@@ -27,11 +27,19 @@ class GMPHourlyDaySelect(CoordinatorEntity, SelectEntity):
         self._attr_unique_id = f"{coordinator.account_id}_hourly_day"
 
         self._current = coordinator.selected_date.isoformat()
+        self._options_cache: tuple[date, list[str]] | None = None
 
     @property
     def options(self) -> list[str]:
+        # HA reads this property far more often than the date rolls over, so
+        # only rebuild the 31-day list when "today" actually changes.
         today = date.today()
-        return [(today - timedelta(days=offset)).isoformat() for offset in range(0, 31)]
+        if self._options_cache is not None and self._options_cache[0] == today:
+            return self._options_cache[1]
+
+        options = [(today - timedelta(days=offset)).isoformat() for offset in range(0, 31)]
+        self._options_cache = (today, options)
+        return options
 
     @property
     def current_option(self) -> str | None:
@@ -10,107 +10,12 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .const import DOMAIN
 
-
-def _strip_usage_values(values: list[dict[str, Any]]) -> list[dict[str, Any]]:
-    allowed = {"date", "consumed", "consumedTotal"}
-    stripped: list[dict[str, Any]] = []
-    for item in values:
-        if not isinstance(item, dict):
-            continue
-        stripped.append({k: item.get(k) for k in allowed if k in item})
-    return stripped
-
-
-def _first_interval(data: dict[str, Any] | None) -> dict[str, Any] | None:
-
-    intervals = (data or {}).get("intervals") or []
-    if not isinstance(intervals, list) or not intervals:
-        return None
-
-    for item in intervals:
-        if isinstance(item, dict):
-            return item
-    return None
-
-
-def _usage_values(data: dict[str, Any] | None) -> list[dict[str, Any]]:
-
-    if not data:
-        return []
-
-    interval = _first_interval(data)
-    if interval and isinstance(interval.get("values"), list):
-        return [v for v in interval.get("values") if isinstance(v, dict)]
-
-    if isinstance(data.get("values"), list):
-        return [v for v in data.get("values") if isinstance(v, dict)]
-
-    nested = data.get("data")
-    if isinstance(nested, dict):
-        return _usage_values(nested)
-
-    # Last resort: find the first list[dict] that looks like usage values.
-    for value in data.values():
-        if isinstance(value, dict):
-            values = _usage_values(value)
-            if values:
-                return values
-        if isinstance(value, list) and value and all(isinstance(v, dict) for v in value):
-            if any(
-                isinstance(v, dict) and ("consumed" in v or "consumedTotal" in v or "date" in v)
-                for v in value
-            ):
-                return value
-
-    return []
-
-
-def _usage_start_end(data: dict[str, Any] | None) -> tuple[Any, Any]:
-    interval = _first_interval(data)
-    if not interval:
-        return None, None
-    return interval.get("start"), interval.get("end")
-
-
-def _latest_numeric(values: list[dict[str, Any]], key: str) -> float | None:
-
-    for item in reversed(values):
-        if not isinstance(item, dict):
-            continue
-        val = item.get(key)
-        if isinstance(val, (int, float)):
-            return float(val)
-    return None
-
-
-def _latest_numeric_any(values: list[dict[str, Any]], keys: tuple[str, ...]) -> float | None:
-
-    for item in reversed(values):
-        if not isinstance(item, dict):
-            continue
-        for key in keys:
-            val = item.get(key)
-            if isinstance(val, (int, float)):
-                return float(val)
-    return None
-
-
-def _power_status(status: dict[str, Any] | None) -> str | None:
-
-    if not status:
-        return None
-    if bool(status.get("meterOff")):
-        return "off"
-    if bool(status.get("partialMeterOff")):
-        return "partial"
-    return "on"
-
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: ConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ):
-    coordinator = hass.data[DOMAIN][entry.entry_id]
+    coordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
 
     async_add_entities(
         [
@@ -146,13 +51,12 @@ class GMPTodayEnergySensor(GMPBaseSensor):
 
     @property
     def native_value(self):
-        return self.coordinator.data.get("today_total")
+        return self.coordinator.snapshot.today_total
 
     @property
     def extra_state_attributes(self):
-        hourly = self.coordinator.data.get("hourly_values") or []
         return {
-            "hourly": _strip_usage_values(hourly)
+            "hourly": self.coordinator.snapshot.hourly_columns
         }
 
 class GMPLastHourEnergySensor(GMPBaseSensor):
@@ -167,7 +71,7 @@ class GMPLastHourEnergySensor(GMPBaseSensor):
 
     @property
     def native_value(self):
-        return self.coordinator.data.get("last_hour_kwh")
+        return self.coordinator.snapshot.last_hour_kwh
 
 
 class GMPAccountStatusSensor(GMPBaseSensor):
@@ -180,18 +84,14 @@ class GMPAccountStatusSensor(GMPBaseSensor):
 
     @property
     def native_value(self) -> str | None:
-        status: dict[str, Any] | None = self.coordinator.data.get("status")
+        status = self.coordinator.snapshot.status
         if not status:
             return None
         return "active" if status.get("active") else "inactive"
 
     @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        status = self.coordinator.data.get("status") or {}
-        return {
-            **status,
-            "power_status": _power_status(status),
-        }
+    def extra_state_attributes(self):
+        return self.coordinator.snapshot.status_with_power
 
 
 class GMPPowerStatusSensor(GMPBaseSensor):
@@ -204,12 +104,11 @@ class GMPPowerStatusSensor(GMPBaseSensor):
 
     @property
     def native_value(self) -> str | None:
-        status: dict[str, Any] | None = self.coordinator.data.get("status")
-        return _power_status(status)
+        return self.coordinator.snapshot.power
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
-        return self.coordinator.data.get("status") or {}
+        return self.coordinator.snapshot.status
 
 
 class GMPDailyUsageSensor(GMPBaseSensor):
@@ -224,21 +123,16 @@ class GMPDailyUsageSensor(GMPBaseSensor):
 
     @property
     def native_value(self) -> float | None:
-        daily: dict[str, Any] | None = self.coordinator.data.get("daily")
-        values = _usage_values(daily)
-        if not values:
-            return None
-        return _latest_numeric_any(values, ("consumed", "consumedTotal"))
+        return self.coordinator.snapshot.daily_latest
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
-        daily: dict[str, Any] | None = self.coordinator.data.get("daily")
-        start, end = _usage_start_end(daily)
-        values = _usage_values(daily)
+        snapshot = self.coordinator.snapshot
+        start, end = snapshot.daily_start_end
         return {
             "start": start,
             "end": end,
-            "values": _strip_usage_values(values),
+            "values": snapshot.daily_columns,
         }
 
 
@@ -254,23 +148,17 @@ class GMPMonthlyUsageSensor(GMPBaseSensor):
 
     @property
     def native_value(self) -> float | None:
-        monthly: dict[str, Any] | None = self.coordinator.data.get("monthly")
-        values = _usage_values(monthly)
-        if not values:
-            return None
-        return _latest_numeric_any(values, ("consumed", "consumedTotal"))
+        return self.coordinator.snapshot.monthly_latest
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
-        monthly: dict[str, Any] | None = self.coordinator.data.get("monthly")
-        start, end = _usage_start_end(monthly)
-        values = _usage_values(monthly)
-        errors = self.coordinator.data.get("errors") or {}
+        snapshot = self.coordinator.snapshot
+        start, end = snapshot.monthly_start_end
         return {
             "start": start,
             "end": end,
-            "values": _strip_usage_values(values),
-            "fetch_error": errors.get("monthly"),
+            "values": snapshot.monthly_columns,
+            "fetch_error": snapshot.errors.get("monthly"),
         }
 
 
@@ -286,60 +174,18 @@ class GMPSelectedDayTotalSensor(GMPBaseSensor):
 
     @property
     def native_value(self) -> float | None:
-        selected: dict[str, Any] | None = self.coordinator.data.get("selected_hourly")
-        values = _usage_values(selected)
-        if not values:
-            return None
-        total = 0.0
-        seen_any = False
-        for item in values:
-            consumed = item.get("consumed")
-            if isinstance(consumed, (int, float)):
-                total += float(consumed)
-                seen_any = True
-        if seen_any:
-            return round(total, 2)
-
-        # Fallback: Some responses only include cumulative totals.
-        consumed_total = _latest_numeric_any(values, ("consumedTotal",))
-        return round(consumed_total, 2) if consumed_total is not None else None
+        return self.coordinator.snapshot.selected_day_total
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
-        selected: dict[str, Any] | None = self.coordinator.data.get("selected_hourly")
-        values = _usage_values(selected)
-        errors = self.coordinator.data.get("errors") or {}
+        snapshot = self.coordinator.snapshot
         return {
-            "selected_date": self.coordinator.data.get("selected_date"),
-            "values": _strip_usage_values(values),
-            "fetch_error": errors.get("selected_hourly"),
+            "selected_date": snapshot.selected_date,
+            "values": snapshot.selected_columns,
+            "fetch_error": snapshot.errors.get("selected_hourly"),
         }
 
 
-def _ev_interval(data: dict[str, Any] | None) -> dict[str, Any] | None:
-    intervals = (data or {}).get("intervals") or []
-    if not intervals:
-        return None
-    first = intervals[0]
-    return first if isinstance(first, dict) else None
-
-
-def _ev_selected_day_value(
-    ev_daily: dict[str, Any] | None, selected_date: str | None
-) -> dict[str, Any] | None:
-    interval = _ev_interval(ev_daily)
-    if not interval or not selected_date:
-        return None
-
-    for item in interval.get("values") or []:
-        if not isinstance(item, dict):
-            continue
-        item_date = item.get("date")
-        if isinstance(item_date, str) and item_date[:10] == selected_date:
-            return item
-    return None
-
-
 class GMPEVEnergyPeriodConsumptionSensor(GMPBaseSensor):
     def __init__(self, coordinator):
         super().__init__(
@@ -352,30 +198,11 @@ class GMPEVEnergyPeriodConsumptionSensor(GMPBaseSensor):
 
     @property
     def native_value(self) -> float | None:
-        ev_daily: dict[str, Any] | None = self.coordinator.data.get("ev_daily")
-        interval = _ev_interval(ev_daily)
-        if not interval:
-            return None
-        total = interval.get("totalConsumption")
-        return float(total) if isinstance(total, (int, float)) else None
+        return self.coordinator.snapshot.ev_total_consumption
 
     @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        ev_daily: dict[str, Any] | None = self.coordinator.data.get("ev_daily")
-        interval = _ev_interval(ev_daily) or {}
-        rates = (ev_daily or {}).get("rates")
-        return {
-            "start": interval.get("start"),
-            "end": interval.get("end"),
-            "totalCost": interval.get("totalCost"),
-            "totalSavings": interval.get("totalSavings"),
-            "totalChargeTime": interval.get("totalChargeTime"),
-            "totalOnPeakConsumption": interval.get("totalOnPeakConsumption"),
-            "totalOffPeakConsumption": interval.get("totalOffPeakConsumption"),
-            "totalOnPeakCost": interval.get("totalOnPeakCost"),
-            "totalOffPeakCost": interval.get("totalOffPeakCost"),
-            "rates": rates,
-        }
+    def extra_state_attributes(self):
+        return self.coordinator.snapshot.ev_period_attrs
 
 
 class GMPEVEnergyPeriodCostSensor(GMPBaseSensor):
@@ -390,12 +217,7 @@ class GMPEVEnergyPeriodCostSensor(GMPBaseSensor):
 
     @property
     def native_value(self) -> float | None:
-        ev_daily: dict[str, Any] | None = self.coordinator.data.get("ev_daily")
-        interval = _ev_interval(ev_daily)
-        if not interval:
-            return None
-        total = interval.get("totalCost")
-        return float(total) if isinstance(total, (int, float)) else None
+        return self.coordinator.snapshot.ev_total_cost
 
 
 class GMPEVSelectedDayConsumptionSensor(GMPBaseSensor):
@@ -410,31 +232,11 @@ class GMPEVSelectedDayConsumptionSensor(GMPBaseSensor):
 
     @property
     def native_value(self) -> float | None:
-        ev_daily: dict[str, Any] | None = self.coordinator.data.get("ev_daily")
-        selected_date: str | None = self.coordinator.data.get("selected_date")
-        item = _ev_selected_day_value(ev_daily, selected_date)
-        if not item:
-            return None
-        consumed = item.get("consumed")
-        return float(consumed) if isinstance(consumed, (int, float)) else None
+        return self.coordinator.snapshot.ev_selected_consumption
 
     @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        ev_daily: dict[str, Any] | None = self.coordinator.data.get("ev_daily")
-        selected_date: str | None = self.coordinator.data.get("selected_date")
-        item = _ev_selected_day_value(ev_daily, selected_date) or {}
-        return {
-            "selected_date": selected_date,
-            "cost": item.get("cost"),
-            "savings": item.get("savings"),
-            "duration": item.get("duration"),
-            "onPeakConsumed": item.get("onPeakConsumed"),
-            "offPeakConsumed": item.get("offPeakConsumed"),
-            "onPeakCost": item.get("onPeakCost"),
-            "offPeakCost": item.get("offPeakCost"),
-            "onPeakDuration": item.get("onPeakDuration"),
-            "offPeakDuration": item.get("offPeakDuration"),
-        }
+    def extra_state_attributes(self):
+        return self.coordinator.snapshot.ev_selected_attrs
 
 
 class GMPEVSelectedDayCostSensor(GMPBaseSensor):
@@ -449,10 +251,4 @@ class GMPEVSelectedDayCostSensor(GMPBaseSensor):
 
     @property
     def native_value(self) -> float | None:
-        ev_daily: dict[str, Any] | None = self.coordinator.data.get("ev_daily")
-        selected_date: str | None = self.coordinator.data.get("selected_date")
-        item = _ev_selected_day_value(ev_daily, selected_date)
-        if not item:
-            return None
-        cost = item.get("cost")
-        return float(cost) if isinstance(cost, (int, float)) else None
+        return self.coordinator.snapshot.ev_selected_cost
@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+from collections import deque
+import math
+from typing import Any
+
+
+def _is_num(v: Any, _int=int, _float=float) -> bool:
+    # JSON payloads never carry int/float subclasses, so two pointer
+    # compares beat isinstance's tuple scan in the per-item loops below.
+    t = type(v)
+    return t is _int or t is _float
+
+
+def columnize_usage(values: list[dict[str, Any]]) -> dict[str, tuple[Any, ...]]:
+    """Pivot usage rows into one tuple per attribute column.
+
+    Three length-N tuples carry the same data as N three-key dicts while
+    allocating far fewer objects, which matters when the monthly payload
+    runs to hundreds of rows re-serialized on every state write.
+    """
+    dates: list[Any] = []
+    consumed: list[Any] = []
+    consumed_total: list[Any] = []
+    for item in values:
+        if type(item) is dict:
+            dates.append(item.get("date"))
+            consumed.append(item.get("consumed"))
+            consumed_total.append(item.get("consumedTotal"))
+    return {
+        "date": tuple(dates),
+        "consumed": tuple(consumed),
+        "consumedTotal": tuple(consumed_total),
+    }
+
+
+def first_interval(data: dict[str, Any] | None) -> dict[str, Any] | None:
+
+    intervals = (data or {}).get("intervals") or []
+    if not isinstance(intervals, list) or not intervals:
+        return None
+
+    # Real payloads carry a single dict here, so check it before falling
+    # back to scanning for the first dict element.
+    first = intervals[0]
+    if type(first) is dict:
+        return first
+    return next((item for item in intervals if type(item) is dict), None)
+
+
+_SENTINEL_KEYS = frozenset(("consumed", "consumedTotal", "date"))
+
+
+def _homogeneous_values(vals: list[Any]) -> list[dict[str, Any]]:
+    # Well-formed payloads are lists of dicts throughout, so hand back the
+    # original list instead of a filtered copy; callers only read it.
+    if not vals or type(vals[0]) is dict:
+        return vals
+    return [v for v in vals if type(v) is dict]
+
+
+def usage_values(
+    data: dict[str, Any] | None, _isinstance=isinstance, _dict=dict, _list=list
+) -> list[dict[str, Any]]:
+    # The default args bind the builtins used by the walk's inner loop as
+    # locals, skipping a globals-then-builtins lookup per node visited.
+    if not data:
+        return []
+
+    # Iterative breadth-first walk; well-formed payloads match one of the
+    # known shapes on the very first node, so the queue only grows for
+    # unexpected responses.
+    queue = deque([data])
+    while queue:
+        node = queue.popleft()
+
+        interval = first_interval(node)
+        if interval is not None:
+            vals = interval.get("values")
+            if _isinstance(vals, _list):
+                return _homogeneous_values(vals)
+
+        vals = node.get("values")
+        if _isinstance(vals, _list):
+            return _homogeneous_values(vals)
+
+        # Last resort: find the first list[dict] that looks like usage values.
+        for value in node.values():
+            if _isinstance(value, _dict):
+                queue.append(value)
+            elif (
+                _isinstance(value, _list)
+                and value
+                and _isinstance(value[0], _dict)
+                and (value[0].keys() & _SENTINEL_KEYS)
+            ):
+                # The first element's keys stand in for the two full
+                # generator passes the recursive version made per list.
+                return value
+
+    return []
+
+
+def usage_start_end(data: dict[str, Any] | None) -> tuple[Any, Any]:
+    interval = first_interval(data)
+    if not interval:
+        return None, None
+    return interval.get("start"), interval.get("end")
+
+
+def latest_numeric_any(
+    values: list[dict[str, Any]],
+    keys: tuple[str, ...],
+    _dict=dict,
+    _float=float,
+    _reversed=reversed,
+) -> float | None:
+
+    # Callers pass at most two keys; unpacking them once avoids iterating
+    # the keys tuple for every item of the reverse scan.
+    primary = keys[0]
+    fallback = keys[1] if len(keys) > 1 else None
+    for item in _reversed(values):
+        if type(item) is not _dict:
+            continue
+        val = item.get(primary)
+        if not _is_num(val) and fallback is not None:
+            val = item.get(fallback)
+        if _is_num(val):
+            return _float(val)
+    return None
+
+
+def selected_day_total(values: list[dict[str, Any]]) -> float | None:
+    """Sum of per-interval consumption, done in C via math.fsum."""
+    nums = [
+        v
+        for v in (item.get("consumed") for item in values if isinstance(item, dict))
+        if _is_num(v)
+    ]
+    if nums:
+        return round(math.fsum(nums), 2)
+
+    # Fallback: Some responses only include cumulative totals.
+    consumed_total = latest_numeric_any(values, ("consumedTotal",))
+    return round(consumed_total, 2) if consumed_total is not None else None
+
+
+def power_status(status: dict[str, Any] | None) -> str | None:
+
+    if not status:
+        return None
+    if bool(status.get("meterOff")):
+        return "off"
+    if bool(status.get("partialMeterOff")):
+        return "partial"
+    return "on"
+
+
+def ev_interval(data: dict[str, Any] | None) -> dict[str, Any] | None:
+    intervals = (data or {}).get("intervals") or []
+    if not intervals:
+        return None
+    first = intervals[0]
+    return first if isinstance(first, dict) else None